@@ -329,12 +329,11 @@ def possible_user_group_mentions(content: str) -> dict[str, Literal["silent", "n
     for mention in USER_GROUP_MENTIONS_RE.finditer(content):
         group_mention = mention.group("match")
 
-        # non-silent mention can override silent.
         if not mention.group("silent"):
+            # non-silent mention can override silent.
             mentions[group_mention] = "non-silent"
-
-        # silent mention should NOT override non-silent.
-        if mention.group("silent") and group_mention not in mentions:
+        elif group_mention not in mentions:
+            # silent mention should NOT override non-silent.
             mentions[group_mention] = "silent"
 
     return mentions
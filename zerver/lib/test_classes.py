@@ -50,6 +50,7 @@ from zerver.actions.message_send import check_send_message, check_send_stream_me
 from zerver.actions.realm_settings import do_change_realm_permission_group_setting
 from zerver.actions.streams import bulk_add_subscriptions, bulk_remove_subscriptions
 from zerver.decorator import do_two_factor_login
+from zerver.lib.bulk_create import bulk_set_users_or_streams_recipient_fields
 from zerver.lib.cache import bounce_key_prefix_for_testing
 from zerver.lib.email_notifications import MissedMessageData, handle_missedmessage_emails
 from zerver.lib.initial_password import initial_password
@@ -112,7 +113,12 @@ from zerver.models import (
 from zerver.models.clients import get_client
 from zerver.models.realms import clear_supported_auth_backends_cache, get_realm
 from zerver.models.streams import StreamTopicsPolicyEnum, get_realm_stream, get_stream
-from zerver.models.users import get_system_bot, get_user, get_user_by_delivery_email
+from zerver.models.users import (
+    get_system_bot,
+    get_user,
+    get_user_by_delivery_email,
+    get_users_by_delivery_email,
+)
 from zerver.openapi.openapi import validate_test_request, validate_test_response
 from zerver.tornado.event_queue import clear_client_event_queues_for_testing
 
@@ -697,10 +703,24 @@ Output:
         email = self.nonreg_user_map[name]
         return get_user_by_delivery_email(email, get_realm("zulip"))
 
-    def example_user(self, name: str) -> UserProfile:
-        email = self.example_user_map[name]
+    @classmethod
+    def example_user(cls, name: str) -> UserProfile:
+        email = cls.example_user_map[name]
         return get_user_by_delivery_email(email, get_realm("zulip"))
 
+    @classmethod
+    def example_users(cls, *names: str) -> list[UserProfile]:
+        """
+        Like example_user, but fetches all of the named users with a
+        single query; returns them in the order of names.
+        """
+        emails = [cls.example_user_map[name] for name in names]
+        users = get_users_by_delivery_email(set(emails), get_realm("zulip")).select_related(
+            "realm", "bot_owner"
+        )
+        users_by_email = {user.delivery_email.lower(): user for user in users}
+        return [users_by_email[email.lower()] for email in emails]
+
     def mit_user(self, name: str) -> UserProfile:
         email = self.mit_user_map[name]
         return self.get_user_from_email(email, get_realm("zephyr"))
@@ -1503,16 +1523,16 @@ Output:
             msg="Different streams! You should compare subscriber_count for the same streams.",
         )
 
-        for stream_id, count_before in counts_before.items():
-            self.assertEqual(
-                count_before + expected_difference,
-                counts_after[stream_id],
-                msg=f"""
-                stream of ID ({stream_id}) should have a subscriber_count of {count_before + expected_difference}.
-                """,
-            )
+        # Compare whole dicts, keyed by stream ID, so a failure still
+        # points out which streams have an unexpected subscriber_count.
+        expected_counts_after = {
+            stream_id: count_before + expected_difference
+            for stream_id, count_before in counts_before.items()
+        }
+        self.assertEqual(expected_counts_after, counts_after)
 
-    def webhook_fixture_data(self, type: str, action: str, file_type: str = "json") -> str:
+    @classmethod
+    def webhook_fixture_data(cls, type: str, action: str, file_type: str = "json") -> str:
         fn = os.path.join(
             os.path.dirname(__file__),
             f"../webhooks/{type}/fixtures/{action}.{file_type}",
@@ -1571,15 +1591,51 @@ Output:
         stream.save(update_fields=["recipient"])
         return stream
 
+    @classmethod
+    def make_streams(
+        cls,
+        stream_names: list[str],
+        realm: Realm | None = None,
+        invite_only: bool = False,
+    ) -> list[Stream]:
+        """
+        Like make_stream, but creates all the streams, and their
+        recipients, with one bulk INSERT each; useful for tests that
+        need many streams.
+        """
+        if realm is None:
+            realm = get_realm("zulip")
+
+        history_public_to_subscribers = get_default_value_for_history_public_to_subscribers(
+            invite_only, None
+        )
+        permission_group_settings = get_default_values_for_stream_permission_group_settings(realm)
+        streams = Stream.objects.bulk_create(
+            Stream(
+                realm=realm,
+                name=stream_name,
+                invite_only=invite_only,
+                history_public_to_subscribers=history_public_to_subscribers,
+                **permission_group_settings,
+            )
+            for stream_name in stream_names
+        )
+        recipients = Recipient.objects.bulk_create(
+            Recipient(type_id=stream.id, type=Recipient.STREAM) for stream in streams
+        )
+        bulk_set_users_or_streams_recipient_fields(Stream, streams, recipients)
+        return streams
+
     INVALID_STREAM_ID = 999999
 
-    def get_stream_id(self, name: str, realm: Realm | None = None) -> int:
+    @classmethod
+    def get_stream_id(cls, name: str, realm: Realm | None = None) -> int:
         if not realm:
             realm = get_realm("zulip")
         try:
             stream = get_realm_stream(name, realm.id)
         except Stream.DoesNotExist:
-            return self.INVALID_STREAM_ID
+            return cls.INVALID_STREAM_ID
         return stream.id
 
     # Subscribe to a stream directly
@@ -2360,12 +2416,26 @@ class ZulipTestCase(ZulipTestCaseMixin, TestCase):
         return {stream.id: stream.subscriber_count for stream in streams}
 
     def fetch_streams_subscriber_count(self, stream_ids: set[int]) -> dict[int, int]:
-        return self.build_streams_subscriber_count(streams=Stream.objects.filter(id__in=stream_ids))
+        return dict(Stream.objects.filter(id__in=stream_ids).values_list("id", "subscriber_count"))
 
-    def fetch_other_streams_subscriber_count(self, stream_ids: set[int]) -> dict[int, int]:
-        return self.build_streams_subscriber_count(
-            streams=Stream.objects.exclude(id__in=stream_ids)
-        )
+    def fetch_all_streams_subscriber_count(self) -> dict[int, int]:
+        return dict(Stream.objects.values_list("id", "subscriber_count"))
+
+    def split_streams_subscriber_count(
+        self, counts: dict[int, int], stream_ids: set[int]
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        """
+        Splits a fetch_all_streams_subscriber_count snapshot into the
+        counts for stream_ids and the counts for all other streams, so
+        that tests need only one query per checkpoint.
+        """
+        streams_counts = {
+            stream_id: count for stream_id, count in counts.items() if stream_id in stream_ids
+        }
+        other_streams_counts = {
+            stream_id: count for stream_id, count in counts.items() if stream_id not in stream_ids
+        }
+        return streams_counts, other_streams_counts
 
 
 def get_row_pks_in_all_tables() -> Iterator[tuple[str, set[int]]]:
@@ -2454,9 +2524,15 @@ class WebhookTestCase(ZulipTestCase):
     # name the main function api_{WEBHOOK_DIR_NAME}_webhook.
     VIEW_FUNCTION_NAME: str | None = None
 
-    @property
-    def test_user(self) -> UserProfile:
-        return self.get_user_from_email(self.TEST_USER_EMAIL, get_realm("zulip"))
+    test_user: UserProfile
+
+    @classmethod
+    @override
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        # Fetched once per class; Django hands each test its own copy,
+        # so changes a test makes to it don't leak into other tests.
+        cls.test_user = get_user(cls.TEST_USER_EMAIL, get_realm("zulip"))
 
     @override
     def setUp(self) -> None:
@@ -2720,8 +2796,8 @@ class MigrationsTestCase(ZulipTransactionTestCase):  # nocoverage
 
         self.setUpBeforeMigration(old_apps)
 
-        # Run the migration to test
-        executor = MigrationExecutor(connection)
+        # Run the migration to test, reusing the executor; reloading
+        # the graph picks up the reversed migrations' applied state.
         executor.loader.build_graph()  # reload.
         executor.migrate(migrate_to)
 
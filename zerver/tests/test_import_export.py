@@ -12,7 +12,7 @@ import orjson
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.management.base import CommandError
-from django.db.models import Q, QuerySet
+from django.db.models import Count, Q, QuerySet
 from django.forms.models import model_to_dict
 from django.test import override_settings
 from django.utils.timezone import now as timezone_now
@@ -1778,6 +1778,17 @@ class RealmImportExportTest(ExportFile):
                 user_profile.recipient_id,
                 Recipient.objects.get(type=Recipient.PERSONAL, type_id=user_profile.id).id,
             )
+        active_subscriber_counts = dict(
+            Subscription.objects.filter(
+                recipient__type=Recipient.STREAM,
+                recipient__type_id__in=Stream.objects.filter(realm=imported_realm).values("id"),
+                active=True,
+                is_user_active=True,
+            )
+            .values_list("recipient_id")
+            .annotate(Count("id"))
+            .order_by()
+        )
         for stream in Stream.objects.filter(realm=imported_realm):
             self.assertEqual(
                 stream.recipient_id,
@@ -1785,9 +1796,7 @@ class RealmImportExportTest(ExportFile):
             )
             self.assertEqual(
                 stream.subscriber_count,
-                Subscription.objects.filter(
-                    recipient=stream.recipient, active=True, is_user_active=True
-                ).count(),
+                active_subscriber_counts.get(stream.recipient_id, 0),
             )
 
         # Check is_imported_stub is False for users imported from another
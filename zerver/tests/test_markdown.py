@@ -69,7 +69,15 @@ from zerver.lib.tex import render_tex
 from zerver.lib.types import UserGroupMembersData
 from zerver.lib.upload import upload_message_attachment
 from zerver.lib.user_groups import UserGroupMembershipDetails
-from zerver.models import Message, NamedUserGroup, RealmEmoji, RealmFilter, UserMessage, UserProfile
+from zerver.models import (
+    Message,
+    NamedUserGroup,
+    Realm,
+    RealmEmoji,
+    RealmFilter,
+    UserMessage,
+    UserProfile,
+)
 from zerver.models.clients import get_client
 from zerver.models.groups import SystemGroups
 from zerver.models.linkifiers import linkifiers_for_realm
@@ -216,6 +224,24 @@ def markdown_convert_wrapper(content: str) -> str:
 
 
 class MarkdownMiscTest(ZulipTestCase):
+    realm: Realm
+    aaron: UserProfile
+    hamlet: UserProfile
+    cordelia: UserProfile
+    iago: UserProfile
+    othello: UserProfile
+
+    @classmethod
+    @override
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.realm = get_realm("zulip")
+        cls.aaron = cls.example_user("aaron")
+        cls.hamlet = cls.example_user("hamlet")
+        cls.cordelia = cls.example_user("cordelia")
+        cls.iago = cls.example_user("iago")
+        cls.othello = cls.example_user("othello")
+
     def test_diffs_work_as_expected(self) -> None:
         str1 = "<p>The quick brown fox jumps over the lazy dog.  Animal stories are fun, yeah</p>"
         str2 = "<p>The fast fox jumps over the lazy dogs and cats.  Animal stories are fun</p>"
@@ -223,13 +249,11 @@ class MarkdownMiscTest(ZulipTestCase):
         self.assertEqual(diff_strings(str1, str2), expected_diff)
 
     def test_get_possible_mentions_info(self) -> None:
-        realm = get_realm("zulip")
-
         def make_user(email: str, full_name: str) -> UserProfile:
             return create_user(
                 email=email,
                 password="whatever",
-                realm=realm,
+                realm=self.realm,
                 full_name=full_name,
             )
 
@@ -243,7 +267,7 @@ class MarkdownMiscTest(ZulipTestCase):
 
         fred4 = make_user("fred4@example.com", "Fred Flintstone")
 
-        mention_backend = MentionBackend(realm.id)
+        mention_backend = MentionBackend(self.realm.id)
         lst = get_possible_mentions_info(
             mention_backend,
             {"Fred Flintstone", "Cordelia, LEAR's daughter", "Not A User"},
@@ -271,25 +295,22 @@ class MarkdownMiscTest(ZulipTestCase):
         )
 
     def test_mention_data(self) -> None:
-        realm = get_realm("zulip")
-        hamlet = self.example_user("hamlet")
-        cordelia = self.example_user("cordelia")
         content = "@**King Hamlet** @**Cordelia, lear's daughter**"
-        mention_backend = MentionBackend(realm.id)
+        mention_backend = MentionBackend(self.realm.id)
         mention_data = MentionData(mention_backend, content, message_sender=None)
-        self.assertEqual(mention_data.get_user_ids(), {hamlet.id, cordelia.id})
+        self.assertEqual(mention_data.get_user_ids(), {self.hamlet.id, self.cordelia.id})
         self.assertEqual(
-            mention_data.get_user_by_id(hamlet.id),
+            mention_data.get_user_by_id(self.hamlet.id),
             FullNameInfo(
-                full_name=hamlet.full_name,
-                id=hamlet.id,
+                full_name=self.hamlet.full_name,
+                id=self.hamlet.id,
                 is_active=True,
             ),
         )
 
         user = mention_data.get_user_by_name("king hamLET")
         assert user is not None
-        self.assertEqual(user.full_name, hamlet.full_name)
+        self.assertEqual(user.full_name, self.hamlet.full_name)
 
         self.assertFalse(mention_data.message_has_stream_wildcards())
         content = "@**King Hamlet** @**Cordelia, lear's daughter** @**all**"
@@ -302,25 +323,25 @@ class MarkdownMiscTest(ZulipTestCase):
         self.assertTrue(mention_data.message_has_topic_wildcards())
 
         content = "@*hamletcharacters*"
-        group = NamedUserGroup.objects.get(realm_for_sharding=realm, name="hamletcharacters")
+        group = NamedUserGroup.objects.get(realm_for_sharding=self.realm, name="hamletcharacters")
         mention_data = MentionData(mention_backend, content, message_sender=None)
-        self.assertEqual(mention_data.get_group_members(group.id), {hamlet.id, cordelia.id})
+        self.assertEqual(
+            mention_data.get_group_members(group.id), {self.hamlet.id, self.cordelia.id}
+        )
 
-        change_user_is_active(cordelia, False)
+        change_user_is_active(self.cordelia, False)
         mention_data = MentionData(mention_backend, content, message_sender=None)
-        self.assertEqual(mention_data.get_group_members(group.id), {hamlet.id})
+        self.assertEqual(mention_data.get_group_members(group.id), {self.hamlet.id})
 
     def test_bulk_user_group_mentions(self) -> None:
-        realm = get_realm("zulip")
-        hamlet = self.example_user("hamlet")
-        cordelia = self.example_user("cordelia")
-        othello = self.example_user("othello")
-        mention_backend = MentionBackend(realm.id)
+        mention_backend = MentionBackend(self.realm.id)
 
         content = ""
         for i in range(5):
             group_name = f"group{i}"
-            check_add_user_group(realm, group_name, [hamlet, cordelia], acting_user=othello)
+            check_add_user_group(
+                self.realm, group_name, [self.hamlet, self.cordelia], acting_user=self.othello
+            )
             content += f" @*{group_name}*"
 
         CONSTANT_QUERY_COUNT = 2  # even if it increases in future, make sure it's constant.
@@ -332,52 +353,50 @@ class MarkdownMiscTest(ZulipTestCase):
         # and make sure each mentioned group has the expected members
         # (i.e. direct and via sub-groups) in mention_data.
 
-        realm = get_realm("zulip")
-        aaron = self.example_user("aaron")
-        hamlet = self.example_user("hamlet")
-        cordelia = self.example_user("cordelia")
-        iago = self.example_user("iago")
-        othello = self.example_user("othello")
-
         good_students = check_add_user_group(
-            realm, "good-students", [aaron, hamlet], acting_user=othello
+            self.realm, "good-students", [self.aaron, self.hamlet], acting_user=self.othello
+        )
+        class_A = check_add_user_group(self.realm, "class-A", [self.iago], acting_user=self.othello)
+        class_B = check_add_user_group(
+            self.realm, "class-B", [self.cordelia], acting_user=self.othello
         )
-        class_A = check_add_user_group(realm, "class-A", [iago], acting_user=othello)
-        class_B = check_add_user_group(realm, "class-B", [cordelia], acting_user=othello)
 
-        add_subgroups_to_user_group(class_A, [good_students], acting_user=othello)
-        add_subgroups_to_user_group(class_B, [good_students], acting_user=othello)
+        add_subgroups_to_user_group(class_A, [good_students], acting_user=self.othello)
+        add_subgroups_to_user_group(class_B, [good_students], acting_user=self.othello)
 
         content = "@*class-A*  @*class-B*"
-        mention_backend = MentionBackend(realm.id)
+        mention_backend = MentionBackend(self.realm.id)
         mention_data = MentionData(mention_backend, content, message_sender=None)
 
         # both groups should have their direct members and the sub-group's members.
-        self.assertEqual(mention_data.get_group_members(class_A.id), {iago.id, aaron.id, hamlet.id})
         self.assertEqual(
-            mention_data.get_group_members(class_B.id), {cordelia.id, aaron.id, hamlet.id}
+            mention_data.get_group_members(class_A.id),
+            {self.iago.id, self.aaron.id, self.hamlet.id},
+        )
+        self.assertEqual(
+            mention_data.get_group_members(class_B.id),
+            {self.cordelia.id, self.aaron.id, self.hamlet.id},
         )
 
     def test_silent_mention_user_groups(self) -> None:
         # silent VS non-silent group mentions, in regard to fetching group membership.
 
-        realm = get_realm("zulip")
-        aaron = self.example_user("aaron")
-        hamlet = self.example_user("hamlet")
-        cordelia = self.example_user("cordelia")
-        iago = self.example_user("iago")
-        othello = self.example_user("othello")
-
-        hamlet_group = NamedUserGroup.objects.get(realm_for_sharding=realm, name="hamletcharacters")
-        zulip_group = check_add_user_group(realm, "zulip_group", [iago, aaron], acting_user=othello)
-        mention_backend = MentionBackend(realm.id)
+        hamlet_group = NamedUserGroup.objects.get(
+            realm_for_sharding=self.realm, name="hamletcharacters"
+        )
+        zulip_group = check_add_user_group(
+            self.realm, "zulip_group", [self.iago, self.aaron], acting_user=self.othello
+        )
+        mention_backend = MentionBackend(self.realm.id)
 
         # mention zulip_group, but silent mention hamlet_group.
         content = "@*zulip_group*, @_*hamletcharacters*"
         mention_data = MentionData(mention_backend, content, message_sender=None)
 
         # non-silent mention should fetch group membership.
-        self.assertEqual(mention_data.get_group_members(zulip_group.id), {iago.id, aaron.id})
+        self.assertEqual(
+            mention_data.get_group_members(zulip_group.id), {self.iago.id, self.aaron.id}
+        )
 
         # silent mention should NOT fetch group membership.
         self.assertEqual(mention_data.get_group_members(hamlet_group.id), set())
@@ -388,12 +407,16 @@ class MarkdownMiscTest(ZulipTestCase):
         # non-silent before silent.
         content = "@*hamletcharacters*, @_*hamletcharacters*"
         mention_data = MentionData(mention_backend, content, message_sender=None)
-        self.assertEqual(mention_data.get_group_members(hamlet_group.id), {hamlet.id, cordelia.id})
+        self.assertEqual(
+            mention_data.get_group_members(hamlet_group.id), {self.hamlet.id, self.cordelia.id}
+        )
 
         # non-silent after silent.
         content = "@_*hamletcharacters*, @*hamletcharacters*"
         mention_data = MentionData(mention_backend, content, message_sender=None)
-        self.assertEqual(mention_data.get_group_members(hamlet_group.id), {hamlet.id, cordelia.id})
+        self.assertEqual(
+            mention_data.get_group_members(hamlet_group.id), {self.hamlet.id, self.cordelia.id}
+        )
 
     def test_invalid_katex_path(self) -> None:
         with self.settings(DEPLOY_ROOT="/nonexistent"):
@@ -1,6 +1,7 @@
-from collections import defaultdict
 from datetime import timedelta
 
+from django.db.models import Count
+
 from zerver.lib.stream_subscription import get_active_subscriptions_for_stream_ids
 from zerver.lib.test_classes import ZulipTestCase
 from zerver.models import Stream
@@ -43,22 +44,22 @@ class TestSubscribeUsers(ZulipTestCase):
         """
 
         realm = get_realm("zulip")
-        streams = Stream.objects.filter(realm=realm)
-        active_subscriptions = get_active_subscriptions_for_stream_ids(
-            {stream.id for stream in streams}
-        ).select_related("recipient")
+        streams = Stream.objects.filter(realm=realm).only("id", "subscriber_count")
 
         # Map stream_id to its No. active subscriptions.
-        expected_subscriber_count: dict[int, int] = defaultdict(int)
-
-        for sub in active_subscriptions:
-            expected_subscriber_count[sub.recipient.type_id] += 1
+        expected_subscriber_count = dict(
+            get_active_subscriptions_for_stream_ids({stream.id for stream in streams})
+            .values_list("recipient__type_id")
+            .annotate(Count("id"))
+            .order_by()
+        )
 
         for stream in streams:
+            stream_expected_subscriber_count = expected_subscriber_count.get(stream.id, 0)
             self.assertEqual(
                 stream.subscriber_count,
-                expected_subscriber_count[stream.id],
+                stream_expected_subscriber_count,
                 msg=f"""
-                stream of ID ({stream.id}) should have a subscriber_count of {expected_subscriber_count[stream.id]}.
+                stream of ID ({stream.id}) should have a subscriber_count of {stream_expected_subscriber_count}.
                 """,
             )
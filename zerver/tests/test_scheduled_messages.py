@@ -1,25 +1,36 @@
 import re
 import time
-from datetime import timedelta
+from datetime import datetime, timedelta
 from io import StringIO
 from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import orjson
 import time_machine
-from django.test import override_settings
 from django.utils.timezone import now as timezone_now
+from typing_extensions import override
 
 from zerver.actions.scheduled_messages import (
     SCHEDULED_MESSAGE_LATE_CUTOFF_MINUTES,
+    check_schedule_message,
+    send_scheduled_message,
     try_deliver_one_scheduled_message,
 )
 from zerver.actions.users import change_user_is_active
-from zerver.lib.message import is_message_to_self
 from zerver.lib.test_classes import ZulipTestCase
 from zerver.lib.test_helpers import most_recent_message
 from zerver.lib.timestamp import timestamp_to_datetime
-from zerver.models import Attachment, Message, Recipient, ScheduledMessage, UserMessage
+from zerver.lib.topic import DB_TOPIC_NAME
+from zerver.models import (
+    Attachment,
+    DirectMessageGroup,
+    Message,
+    Recipient,
+    ScheduledMessage,
+    UserMessage,
+    UserProfile,
+)
+from zerver.models.clients import get_client
 from zerver.models.recipients import get_or_create_direct_message_group
 
 if TYPE_CHECKING:
@@ -27,12 +38,48 @@ if TYPE_CHECKING:
 
 
 class ScheduledMessageTest(ZulipTestCase):
+    hamlet: UserProfile
+    othello: UserProfile
+    verona_stream_id: int
+    fixed_now: datetime
+    direct_message_group: DirectMessageGroup
+    self_direct_message_group: DirectMessageGroup
+
+    @classmethod
+    @override
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.hamlet = cls.example_user("hamlet")
+        cls.othello = cls.example_user("othello")
+        cls.verona_stream_id = cls.get_stream_id("Verona")
+        # A single frozen "now" for the delivery tests, truncated to
+        # whole seconds so it survives the round-trip through
+        # scheduled_delivery_timestamp unchanged.
+        cls.fixed_now = timezone_now().replace(microsecond=0)
+        cls.direct_message_group = get_or_create_direct_message_group(
+            id_list=[cls.hamlet.id, cls.othello.id]
+        )
+        cls.self_direct_message_group = get_or_create_direct_message_group(id_list=[cls.hamlet.id])
+
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+        self.login("hamlet")
+
     def last_scheduled_message(self) -> ScheduledMessage:
-        return ScheduledMessage.objects.all().order_by("-id")[0]
+        return ScheduledMessage.objects.latest("id")
 
     def get_scheduled_message(self, id: str) -> ScheduledMessage:
         return ScheduledMessage.objects.get(id=id)
 
+    def user_message_read_flag(self, message_id: int, user_id: int) -> bool:
+        flags = (
+            UserMessage.objects.filter(message_id=message_id, user_profile_id=user_id)
+            .values_list("flags", flat=True)
+            .get()
+        )
+        return bool(int(flags) & UserMessage.flags.read.mask)
+
     def do_schedule_message(
         self,
         msg_type: str,
@@ -40,15 +87,13 @@ class ScheduledMessageTest(ZulipTestCase):
         msg: str,
         scheduled_delivery_timestamp: int,
     ) -> "TestHttpResponse":
-        self.login("hamlet")
-
         topic_name = ""
         if msg_type in ["stream", "channel"]:
             topic_name = "Test topic"
 
         payload = {
             "type": msg_type,
-            "to": orjson.dumps(to).decode(),
+            "to": str(to) if isinstance(to, int) else orjson.dumps(to).decode(),
             "content": msg,
             "topic": topic_name,
             "scheduled_delivery_timestamp": scheduled_delivery_timestamp,
@@ -60,11 +105,10 @@ class ScheduledMessageTest(ZulipTestCase):
     def test_schedule_message(self) -> None:
         content = "Test message"
         scheduled_delivery_timestamp = int(time.time() + 86400)
-        verona_stream_id = self.get_stream_id("Verona")
 
         # Scheduling a message to a stream you are subscribed is successful.
         result = self.do_schedule_message(
-            "channel", verona_stream_id, f"{content} 1", scheduled_delivery_timestamp
+            "channel", self.verona_stream_id, f"{content} 1", scheduled_delivery_timestamp
         )
         scheduled_message = self.last_scheduled_message()
         self.assert_json_success(result)
@@ -77,9 +121,8 @@ class ScheduledMessageTest(ZulipTestCase):
         )
 
         # Scheduling a direct message with user IDs is successful.
-        othello = self.example_user("othello")
         result = self.do_schedule_message(
-            "direct", [othello.id], f"{content} 3", scheduled_delivery_timestamp
+            "direct", [self.othello.id], f"{content} 3", scheduled_delivery_timestamp
         )
         scheduled_message = self.last_scheduled_message()
         self.assert_json_success(result)
@@ -93,7 +136,7 @@ class ScheduledMessageTest(ZulipTestCase):
 
         # Cannot schedule a direct message with user emails.
         result = self.do_schedule_message(
-            "direct", [othello.email], f"{content} 4", scheduled_delivery_timestamp
+            "direct", [self.othello.email], f"{content} 4", scheduled_delivery_timestamp
         )
         self.assert_json_error(result, 'to["int"] is not an integer')
 
@@ -101,188 +144,199 @@ class ScheduledMessageTest(ZulipTestCase):
         content = "Test message"
         scheduled_delivery_datetime = timezone_now() + timedelta(minutes=5)
         scheduled_delivery_timestamp = int(scheduled_delivery_datetime.timestamp())
-        verona_stream_id = self.get_stream_id("Verona")
         result = self.do_schedule_message(
-            "channel", verona_stream_id, f"{content} 1", scheduled_delivery_timestamp
+            "channel", self.verona_stream_id, f"{content} 1", scheduled_delivery_timestamp
         )
         self.assert_json_success(result)
 
-    def assert_scheduled_message_delivered(
-        self, scheduled_message: ScheduledMessage, recipient: Recipient | None
-    ) -> None:
-        sender = self.example_user("hamlet")
-
+    def deliver_scheduled_message(
+        self,
+        scheduled_message: ScheduledMessage,
+        scheduled_delivery_datetime: datetime,
+        *,
+        find_due_message: bool = True,
+    ) -> int:
         # mock current time to be greater than the scheduled time, so that the `scheduled_message` can be sent.
-        more_than_scheduled_delivery_datetime = scheduled_message.scheduled_timestamp + timedelta(
-            minutes=1
-        )
+        more_than_scheduled_delivery_datetime = scheduled_delivery_datetime + timedelta(minutes=1)
 
-        with (
-            time_machine.travel(more_than_scheduled_delivery_datetime, tick=False),
-            self.assertLogs(level="INFO") as logs,
-        ):
-            result = try_deliver_one_scheduled_message()
-            self.assertTrue(result)
+        with time_machine.travel(more_than_scheduled_delivery_datetime, tick=False):
+            if find_due_message:
+                with self.assertLogs(level="INFO") as logs:
+                    result = try_deliver_one_scheduled_message()
+                self.assertTrue(result)
+                self.assertEqual(
+                    logs.output,
+                    [
+                        f"INFO:root:Sending scheduled message {scheduled_message.id} with date {scheduled_message.scheduled_timestamp} (sender: {scheduled_message.sender_id})"
+                    ],
+                )
+            else:
+                # We already hold the row to deliver, so skip the scan
+                # for due scheduled messages.
+                send_scheduled_message(scheduled_message)
+            delivery_state = ScheduledMessage.objects.values(
+                "delivered", "failed", "delivered_message_id"
+            ).get(id=scheduled_message.id)
+
+        delivered_message_id = delivery_state["delivered_message_id"]
+        assert isinstance(delivered_message_id, int)
+        self.assertEqual(delivery_state["delivered"], True)
+        self.assertEqual(delivery_state["failed"], False)
+        return delivered_message_id
+
+    def assert_scheduled_message_delivered(
+        self,
+        scheduled_message: ScheduledMessage,
+        recipient_id: int | None,
+        scheduled_delivery_datetime: datetime,
+        read_by_sender: bool,
+        *,
+        find_due_message: bool = True,
+    ) -> None:
+        delivered_message_id = self.deliver_scheduled_message(
+            scheduled_message, scheduled_delivery_datetime, find_due_message=find_due_message
+        )
+        self.assertEqual(scheduled_message.recipient_id, recipient_id)
+        self.assertEqual(scheduled_message.sender_id, self.hamlet.id)
+
+        # One query for the delivered message's columns, and one for the
+        # sender's UserMessage flags.
+        with self.assert_database_query_count(2):
+            delivered_message = Message.objects.values(
+                "content",
+                "rendered_content",
+                DB_TOPIC_NAME,
+                "date_sent",
+                "recipient_id",
+                "sender_id",
+            ).get(id=delivered_message_id)
+            self.assertEqual(delivered_message["content"], scheduled_message.content)
             self.assertEqual(
-                logs.output,
-                [
-                    f"INFO:root:Sending scheduled message {scheduled_message.id} with date {scheduled_message.scheduled_timestamp} (sender: {scheduled_message.sender_id})"
-                ],
+                delivered_message["rendered_content"], scheduled_message.rendered_content
             )
-            scheduled_message.refresh_from_db()
-
-            assert isinstance(scheduled_message.delivered_message_id, int)
-            self.assertEqual(scheduled_message.delivered, True)
-            self.assertEqual(scheduled_message.failed, False)
-            self.assertEqual(scheduled_message.recipient, recipient)
-            self.assertEqual(scheduled_message.sender, sender)
-
-            delivered_message = Message.objects.get(id=scheduled_message.delivered_message_id)
-            self.assertEqual(delivered_message.content, scheduled_message.content)
-            self.assertEqual(delivered_message.rendered_content, scheduled_message.rendered_content)
-            self.assertEqual(delivered_message.topic_name(), scheduled_message.topic_name())
-            self.assertEqual(delivered_message.date_sent, more_than_scheduled_delivery_datetime)
-            self.assertEqual(delivered_message.recipient, scheduled_message.recipient)
-            self.assertEqual(delivered_message.sender, scheduled_message.sender)
-
-            sender_user_message = UserMessage.objects.get(
-                message_id=scheduled_message.delivered_message_id, user_profile_id=sender.id
+            self.assertEqual(delivered_message[DB_TOPIC_NAME], scheduled_message.topic_name())
+            self.assertEqual(
+                delivered_message["date_sent"], scheduled_delivery_datetime + timedelta(minutes=1)
             )
+            self.assertEqual(delivered_message["recipient_id"], scheduled_message.recipient_id)
+            self.assertEqual(delivered_message["sender_id"], scheduled_message.sender_id)
             self.assertEqual(
-                sender_user_message.flags.read, not is_message_to_self(delivered_message)
+                self.user_message_read_flag(delivered_message_id, self.hamlet.id), read_by_sender
             )
 
     def test_successful_deliver_stream_scheduled_message(self) -> None:
-        # No scheduled message
-        result = try_deliver_one_scheduled_message()
-        self.assertFalse(result)
-
-        self.create_scheduled_message()
-        scheduled_message = self.last_scheduled_message()
-
-        stream_id = self.get_stream_id("Verona")
-        recipient = Recipient.objects.get(type=Recipient.STREAM, type_id=stream_id)
-        self.assert_scheduled_message_delivered(scheduled_message, recipient)
-
-    def test_successful_deliver_direct_scheduled_message_to_other(self) -> None:
-        # No scheduled message
-        self.assertFalse(try_deliver_one_scheduled_message())
-
-        content = "Test message"
-        scheduled_delivery_datetime = timezone_now() + timedelta(minutes=5)
-        scheduled_delivery_timestamp = int(scheduled_delivery_datetime.timestamp())
-        othello = self.example_user("othello")
-        response = self.do_schedule_message(
-            "direct", [othello.id], f"{content} 3", scheduled_delivery_timestamp
-        )
-        self.assert_json_success(response)
-        scheduled_message = self.last_scheduled_message()
-
-        self.assert_scheduled_message_delivered(scheduled_message, recipient=othello.recipient)
-
-        # Check error is sent if an edit happens after the scheduled
-        # message is successfully sent.
-        new_delivery_datetime = timezone_now() + timedelta(minutes=7)
-        new_delivery_timestamp = int(new_delivery_datetime.timestamp())
-        content = "New message content"
-        payload = {
-            "content": content,
-            "scheduled_delivery_timestamp": new_delivery_timestamp,
-        }
-        updated_response = self.client_patch(
-            f"/json/scheduled_messages/{scheduled_message.id}", payload
-        )
-        self.assert_json_error(updated_response, "Scheduled message was already sent")
-
-    @override_settings(PREFER_DIRECT_MESSAGE_GROUP=True)
-    def test_successful_deliver_personal_scheduled_message_using_direct_message_group(self) -> None:
-        # No scheduled message
-        self.assertFalse(try_deliver_one_scheduled_message())
-
-        content = "Test message"
-        scheduled_delivery_datetime = timezone_now() + timedelta(minutes=5)
-        scheduled_delivery_timestamp = int(scheduled_delivery_datetime.timestamp())
-        sender = self.example_user("hamlet")
-        othello = self.example_user("othello")
-
-        # Create a direct message group for the sender and othello.
-        direct_message_group = get_or_create_direct_message_group(id_list=[sender.id, othello.id])
+        with time_machine.travel(self.fixed_now, tick=False):
+            # No scheduled message
+            self.assertFalse(try_deliver_one_scheduled_message())
 
-        response = self.do_schedule_message(
-            "direct", [othello.id], f"{content} 4", scheduled_delivery_timestamp
-        )
-        self.assert_json_success(response)
-        scheduled_message = self.last_scheduled_message()
-
-        # mock current time to be greater than the scheduled time.
-        more_than_scheduled_delivery_datetime = scheduled_delivery_datetime + timedelta(minutes=1)
+            self.create_scheduled_message()
+            scheduled_message = self.last_scheduled_message()
 
-        with (
-            time_machine.travel(more_than_scheduled_delivery_datetime, tick=False),
-            self.assertLogs(level="INFO") as logs,
-        ):
-            result = try_deliver_one_scheduled_message()
-            self.assertTrue(result)
-            self.assertEqual(
-                logs.output,
-                [
-                    f"INFO:root:Sending scheduled message {scheduled_message.id} with date {scheduled_message.scheduled_timestamp} (sender: {scheduled_message.sender_id})"
-                ],
+            recipient = Recipient.objects.get(type=Recipient.STREAM, type_id=self.verona_stream_id)
+            self.assert_scheduled_message_delivered(
+                scheduled_message,
+                recipient.id,
+                self.fixed_now + timedelta(minutes=5),
+                read_by_sender=True,
             )
-            scheduled_message.refresh_from_db()
-            assert isinstance(scheduled_message.delivered_message_id, int)
-            self.assertEqual(scheduled_message.delivered, True)
-            self.assertEqual(scheduled_message.failed, False)
-            delivered_message = Message.objects.get(id=scheduled_message.delivered_message_id)
-            self.assertEqual(delivered_message.content, scheduled_message.content)
-            self.assertEqual(delivered_message.recipient, direct_message_group.recipient)
-            self.assertEqual(delivered_message.rendered_content, scheduled_message.rendered_content)
-            self.assertEqual(delivered_message.date_sent, more_than_scheduled_delivery_datetime)
-            sender_user_message = UserMessage.objects.get(
-                message_id=scheduled_message.delivered_message_id, user_profile_id=sender.id
-            )
-            self.assertTrue(sender_user_message.flags.read)
-
-    def test_successful_deliver_direct_scheduled_message_to_self(self) -> None:
-        # No scheduled message
-        self.assertFalse(try_deliver_one_scheduled_message())
-
-        content = "Test message to self"
-        scheduled_delivery_datetime = timezone_now() + timedelta(minutes=5)
-        scheduled_delivery_timestamp = int(scheduled_delivery_datetime.timestamp())
-        sender = self.example_user("hamlet")
-        response = self.do_schedule_message(
-            "direct", [sender.id], content, scheduled_delivery_timestamp
-        )
-        self.assert_json_success(response)
-        scheduled_message = self.last_scheduled_message()
-
-        self.assert_scheduled_message_delivered(scheduled_message, recipient=sender.recipient)
 
-    @override_settings(PREFER_DIRECT_MESSAGE_GROUP=True)
-    def test_successful_deliver_direct_scheduled_message_to_self_using_direct_message_group(
-        self,
-    ) -> None:
-        # No scheduled message
-        self.assertFalse(try_deliver_one_scheduled_message())
-
-        content = "Test message to self"
-        scheduled_delivery_datetime = timezone_now() + timedelta(minutes=5)
-        scheduled_delivery_timestamp = int(scheduled_delivery_datetime.timestamp())
-        sender = self.example_user("hamlet")
-
-        # Create a direct message group for the sender.
-        direct_message_group = get_or_create_direct_message_group(id_list=[sender.id])
-
-        response = self.do_schedule_message(
-            "direct", [sender.id], content, scheduled_delivery_timestamp
-        )
-        self.assert_json_success(response)
-        scheduled_message = self.last_scheduled_message()
-
-        self.assert_scheduled_message_delivered(
-            scheduled_message, recipient=direct_message_group.recipient
-        )
+    def test_successful_deliver_scheduled_message(self) -> None:
+        verona_recipient = Recipient.objects.get(
+            type=Recipient.STREAM, type_id=self.verona_stream_id
+        )
+
+        # (name, recipient type, to, expected recipient ID,
+        # PREFER_DIRECT_MESSAGE_GROUP, marked as read for the sender)
+        #
+        # Scheduled messages sent from the web app are marked as read for
+        # the sender when delivered, unless they were sent to themselves.
+        cases: list[tuple[str, str, list[int], int | None, bool, bool]] = [
+            ("channel", "stream", [self.verona_stream_id], verona_recipient.id, False, True),
+            (
+                "direct_to_other",
+                "private",
+                [self.othello.id],
+                self.othello.recipient_id,
+                False,
+                True,
+            ),
+            (
+                "direct_to_other_using_direct_message_group",
+                "private",
+                [self.othello.id],
+                self.direct_message_group.recipient_id,
+                True,
+                True,
+            ),
+            (
+                "direct_to_self",
+                "private",
+                [self.hamlet.id],
+                self.hamlet.recipient_id,
+                False,
+                False,
+            ),
+            (
+                "direct_to_self_using_direct_message_group",
+                "private",
+                [self.hamlet.id],
+                self.self_direct_message_group.recipient_id,
+                True,
+                False,
+            ),
+        ]
+
+        with time_machine.travel(self.fixed_now, tick=False):
+            # Every case is scheduled for, and delivered at, the same time.
+            scheduled_delivery_datetime = self.fixed_now + timedelta(minutes=5)
+
+            # Scheduling through the API is covered by the other tests
+            # in this class; here we only care about delivery, so we
+            # schedule via the action directly.
+            for (
+                name,
+                recipient_type_name,
+                message_to,
+                recipient_id,
+                prefer_direct_message_group,
+                read_by_sender,
+            ) in cases:
+                with (
+                    self.subTest(name=name),
+                    self.settings(PREFER_DIRECT_MESSAGE_GROUP=prefer_direct_message_group),
+                ):
+                    scheduled_message_id = check_schedule_message(
+                        self.hamlet,
+                        get_client("website"),
+                        recipient_type_name,
+                        message_to,
+                        "Test topic" if recipient_type_name == "stream" else None,
+                        "Test message",
+                        scheduled_delivery_datetime,
+                        self.hamlet.realm,
+                    )
+                    scheduled_message = self.get_scheduled_message(str(scheduled_message_id))
+
+                    self.assert_scheduled_message_delivered(
+                        scheduled_message,
+                        recipient_id,
+                        scheduled_delivery_datetime,
+                        read_by_sender,
+                        find_due_message=False,
+                    )
+
+            # Check error is sent if an edit happens after the scheduled
+            # message is successfully sent.
+            new_delivery_datetime = self.fixed_now + timedelta(minutes=7)
+            new_delivery_timestamp = int(new_delivery_datetime.timestamp())
+            payload = {
+                "content": "New message content",
+                "scheduled_delivery_timestamp": new_delivery_timestamp,
+            }
+            updated_response = self.client_patch(
+                f"/json/scheduled_messages/{scheduled_message.id}", payload
+            )
+            self.assert_json_error(updated_response, "Scheduled message was already sent")
 
     def verify_deliver_scheduled_message_failure(
         self, scheduled_message: ScheduledMessage, expected_failure_message: str
@@ -463,22 +517,20 @@ class ScheduledMessageTest(ZulipTestCase):
     def test_scheduling_in_past(self) -> None:
         # Scheduling a message in past should fail.
         content = "Test message"
-        verona_stream_id = self.get_stream_id("Verona")
         scheduled_delivery_timestamp = int(time.time() - 86400)
 
         result = self.do_schedule_message(
-            "channel", verona_stream_id, f"{content} 1", scheduled_delivery_timestamp
+            "channel", self.verona_stream_id, f"{content} 1", scheduled_delivery_timestamp
         )
         self.assert_json_error(result, "Scheduled delivery time must be in the future.")
 
     def test_edit_schedule_message(self) -> None:
         content = "Original test message"
         scheduled_delivery_timestamp = int(time.time() + 86400)
-        verona_stream_id = self.get_stream_id("Verona")
 
         # Scheduling a message to a stream you are subscribed is successful.
         result = self.do_schedule_message(
-            "channel", verona_stream_id, content, scheduled_delivery_timestamp
+            "channel", self.verona_stream_id, content, scheduled_delivery_timestamp
         )
         scheduled_message = self.last_scheduled_message()
         self.assert_json_success(result)
@@ -496,7 +548,7 @@ class ScheduledMessageTest(ZulipTestCase):
         # results in no changes to the scheduled message.
         payload = {
             "type": "stream",
-            "to": orjson.dumps(verona_stream_id).decode(),
+            "to": orjson.dumps(self.verona_stream_id).decode(),
             "topic": "Test topic",
         }
         result = self.client_patch(f"/json/scheduled_messages/{scheduled_message_id}", payload)
@@ -504,7 +556,7 @@ class ScheduledMessageTest(ZulipTestCase):
 
         scheduled_message = self.get_scheduled_message(str(scheduled_message_id))
         self.assertEqual(scheduled_message.recipient.type, Recipient.STREAM)
-        self.assertEqual(scheduled_message.stream_id, verona_stream_id)
+        self.assertEqual(scheduled_message.stream_id, self.verona_stream_id)
         self.assertEqual(scheduled_message.content, "Original test message")
         self.assertEqual(scheduled_message.topic_name(), "Test topic")
         self.assertEqual(
@@ -526,8 +578,7 @@ class ScheduledMessageTest(ZulipTestCase):
         )
 
         # Edit message `type` with valid `to` parameter succeeds
-        othello = self.example_user("othello")
-        to = [othello.id]
+        to = [self.othello.id]
         payload = {"type": "direct", "to": orjson.dumps(to).decode()}
         result = self.client_patch(f"/json/scheduled_messages/{scheduled_message_id}", payload)
         self.assert_json_success(result)
@@ -551,7 +602,7 @@ class ScheduledMessageTest(ZulipTestCase):
         # Trying to edit `type` to stream message type without a `topic` returns an error
         payload = {
             "type": "channel",
-            "to": orjson.dumps(verona_stream_id).decode(),
+            "to": orjson.dumps(self.verona_stream_id).decode(),
         }
         result = self.client_patch(f"/json/scheduled_messages/{scheduled_message_id}", payload)
         self.assert_json_error(
@@ -561,7 +612,7 @@ class ScheduledMessageTest(ZulipTestCase):
         # Edit message `type` to stream with valid `to` and `topic` succeeds
         payload = {
             "type": "channel",
-            "to": orjson.dumps(verona_stream_id).decode(),
+            "to": orjson.dumps(self.verona_stream_id).decode(),
             "topic": "New test topic",
         }
         result = self.client_patch(f"/json/scheduled_messages/{scheduled_message_id}", payload)
@@ -629,16 +680,16 @@ class ScheduledMessageTest(ZulipTestCase):
         )
 
     def test_fetch_scheduled_messages(self) -> None:
-        self.login("hamlet")
         # No scheduled message
         result = self.client_get("/json/scheduled_messages")
         self.assert_json_success(result)
         self.assert_length(orjson.loads(result.content)["scheduled_messages"], 0)
 
-        verona_stream_id = self.get_stream_id("Verona")
         content = "Test message"
         scheduled_delivery_timestamp = int(time.time() + 86400)
-        self.do_schedule_message("channel", verona_stream_id, content, scheduled_delivery_timestamp)
+        self.do_schedule_message(
+            "channel", self.verona_stream_id, content, scheduled_delivery_timestamp
+        )
 
         # Single scheduled message
         result = self.client_get("/json/scheduled_messages")
@@ -650,16 +701,15 @@ class ScheduledMessageTest(ZulipTestCase):
             scheduled_messages[0]["scheduled_message_id"], self.last_scheduled_message().id
         )
         self.assertEqual(scheduled_messages[0]["content"], content)
-        self.assertEqual(scheduled_messages[0]["to"], verona_stream_id)
+        self.assertEqual(scheduled_messages[0]["to"], self.verona_stream_id)
         self.assertEqual(scheduled_messages[0]["type"], "stream")
         self.assertEqual(scheduled_messages[0]["topic"], "Test topic")
         self.assertEqual(
             scheduled_messages[0]["scheduled_delivery_timestamp"], scheduled_delivery_timestamp
         )
 
-        othello = self.example_user("othello")
         result = self.do_schedule_message(
-            "direct", [othello.id], f"{content} 3", scheduled_delivery_timestamp
+            "direct", [self.othello.id], f"{content} 3", scheduled_delivery_timestamp
         )
 
         # Multiple scheduled messages
@@ -675,19 +725,17 @@ class ScheduledMessageTest(ZulipTestCase):
         self.assert_length(orjson.loads(result.content)["scheduled_messages"], 0)
 
     def test_delete_scheduled_messages(self) -> None:
-        self.login("hamlet")
-
         content = "Test message"
-        verona_stream_id = self.get_stream_id("Verona")
         scheduled_delivery_timestamp = int(time.time() + 86400)
 
-        self.do_schedule_message("channel", verona_stream_id, content, scheduled_delivery_timestamp)
+        self.do_schedule_message(
+            "channel", self.verona_stream_id, content, scheduled_delivery_timestamp
+        )
         scheduled_message = self.last_scheduled_message()
         self.logout()
 
         # Other user cannot delete it.
-        othello = self.example_user("othello")
-        result = self.api_delete(othello, f"/api/v1/scheduled_messages/{scheduled_message.id}")
+        result = self.api_delete(self.othello, f"/api/v1/scheduled_messages/{scheduled_message.id}")
         self.assert_json_error(result, "Scheduled message does not exist", 404)
 
         self.login("hamlet")
@@ -699,10 +747,6 @@ class ScheduledMessageTest(ZulipTestCase):
         self.assert_json_error(result, "Scheduled message does not exist", 404)
 
     def test_attachment_handling(self) -> None:
-        self.login("hamlet")
-        hamlet = self.example_user("hamlet")
-        verona_stream_id = self.get_stream_id("Verona")
-
         attachment_file1 = StringIO("zulip!")
         attachment_file1.name = "dummy_1.txt"
         result = self.client_post("/json/user_uploads", {"file": attachment_file1})
@@ -715,11 +759,13 @@ class ScheduledMessageTest(ZulipTestCase):
         path_id2 = re.sub(r"/user_uploads/", "", result.json()["url"])
         attachment_object2 = Attachment.objects.get(path_id=path_id2)
 
-        content = f"Test [zulip.txt](http://{hamlet.realm.host}/user_uploads/{path_id1})"
+        content = f"Test [zulip.txt](http://{self.hamlet.realm.host}/user_uploads/{path_id1})"
         scheduled_delivery_timestamp = int(time.time() + 86400)
 
         # Test sending with attachment
-        self.do_schedule_message("channel", verona_stream_id, content, scheduled_delivery_timestamp)
+        self.do_schedule_message(
+            "channel", self.verona_stream_id, content, scheduled_delivery_timestamp
+        )
         scheduled_message = self.last_scheduled_message()
         self.assertEqual(
             list(attachment_object1.scheduled_messages.all().values_list("id", flat=True)),
@@ -728,7 +774,9 @@ class ScheduledMessageTest(ZulipTestCase):
         self.assertEqual(scheduled_message.has_attachment, True)
 
         # Test editing to change attachmment
-        edited_content = f"Test [zulip.txt](http://{hamlet.realm.host}/user_uploads/{path_id2})"
+        edited_content = (
+            f"Test [zulip.txt](http://{self.hamlet.realm.host}/user_uploads/{path_id2})"
+        )
         payload = {
             "content": edited_content,
         }
@@ -761,9 +809,7 @@ class ScheduledMessageTest(ZulipTestCase):
         self.assertEqual(scheduled_message.has_attachment, False)
 
         # Test editing to now have an attachment again
-        edited_content = (
-            f"Attachment is back! [zulip.txt](http://{hamlet.realm.host}/user_uploads/{path_id2})"
-        )
+        edited_content = f"Attachment is back! [zulip.txt](http://{self.hamlet.realm.host}/user_uploads/{path_id2})"
         payload = {
             "content": edited_content,
         }
@@ -1870,39 +1870,35 @@ class UserSignUpTest(ZulipTestCase):
         """
         Verify that signing up successfully increments subscriber_count by 1
         for that new user subscribed streams.
+
+        The signup HTTP flow is covered by the verify_signup tests; here
+        we create the user directly, which subscribes them to the default
+        streams through the same code path.
         """
-        email = "newguy@zulip.com"
-        password = "newpassword"
         realm = get_realm("zulip")
 
-        all_streams_subscriber_count = self.build_streams_subscriber_count(
-            streams=Stream.objects.all()
-        )
-
-        result = self.verify_signup(email=email, password=password, realm=realm)
-        assert isinstance(result, UserProfile)
-
-        user_profile = result
-        user_stream_ids = {stream.id for stream in get_user_subscribed_streams(user_profile)}
+        all_streams_subscriber_count = self.fetch_all_streams_subscriber_count()
 
-        streams_subscriber_counts_before = {
-            stream_id: count
-            for stream_id, count in all_streams_subscriber_count.items()
-            if stream_id in user_stream_ids
-        }
-
-        other_streams_subscriber_counts_before = {
-            stream_id: count
-            for stream_id, count in all_streams_subscriber_count.items()
-            if stream_id not in user_stream_ids
-        }
+        user_profile = do_create_user(
+            email="newguy@zulip.com",
+            password="newpassword",
+            realm=realm,
+            full_name="New user's name",
+            acting_user=None,
+        )
+        user_stream_ids = set(
+            get_user_subscribed_streams(user_profile).values_list("id", flat=True)
+        )
 
-        # DB-refresh streams.
-        streams_subscriber_counts_after = self.fetch_streams_subscriber_count(user_stream_ids)
+        streams_subscriber_counts_before, other_streams_subscriber_counts_before = (
+            self.split_streams_subscriber_count(all_streams_subscriber_count, user_stream_ids)
+        )
 
-        # DB-refresh other_streams.
-        other_streams_subscriber_counts_after = self.fetch_other_streams_subscriber_count(
-            user_stream_ids
+        # DB-refresh streams and other_streams.
+        streams_subscriber_counts_after, other_streams_subscriber_counts_after = (
+            self.split_streams_subscriber_count(
+                self.fetch_all_streams_subscriber_count(), user_stream_ids
+            )
         )
 
         # Signing up a user should result in subscriber_count + 1
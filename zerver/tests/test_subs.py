@@ -1,6 +1,6 @@
 import hashlib
 import random
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from datetime import timedelta
 from io import StringIO
 from typing import TYPE_CHECKING, Any
@@ -4805,167 +4805,6 @@ class SubscriptionAPITest(ZulipTestCase):
                 ),
             )
 
-    def test_stream_subscriber_count_upon_bulk_subscription(self) -> None:
-        """
-        Test subscriber_count increases for the correct streams
-        upon bulk subscription.
-
-        We use the api here as we want this to be end-to-end.
-        """
-
-        stream_names = [f"stream_{i}" for i in range(10)]
-        stream_ids = {self.make_stream(stream_name).id for stream_name in stream_names}
-
-        desdemona = self.example_user("desdemona")
-        self.login_user(desdemona)
-
-        user_ids = [
-            desdemona.id,
-            self.example_user("cordelia").id,
-            self.example_user("hamlet").id,
-            self.example_user("othello").id,
-            self.example_user("iago").id,
-            self.example_user("prospero").id,
-        ]
-
-        streams_subscriber_counts_before_subscribe = self.fetch_streams_subscriber_count(stream_ids)
-        other_streams_subscriber_counts_before_subscribe = (
-            self.fetch_other_streams_subscriber_count(stream_ids)
-        )
-
-        # Subscribe users to the streams.
-        self.subscribe_via_post(
-            desdemona,
-            stream_names,
-            dict(principals=orjson.dumps(user_ids).decode()),
-        )
-
-        # DB-refresh streams.
-        streams_subscriber_counts_after_subscribe = self.fetch_streams_subscriber_count(stream_ids)
-        # DB-refresh other streams.
-        other_streams_subscriber_counts_after_subscribe = self.fetch_other_streams_subscriber_count(
-            stream_ids
-        )
-
-        # Ensure an increase in subscriber_count
-        self.assert_stream_subscriber_count(
-            streams_subscriber_counts_before_subscribe,
-            streams_subscriber_counts_after_subscribe,
-            expected_difference=len(user_ids),
-        )
-
-        # Make sure other streams are not affected.
-        self.assert_stream_subscriber_count(
-            other_streams_subscriber_counts_before_subscribe,
-            other_streams_subscriber_counts_after_subscribe,
-            expected_difference=0,
-        )
-
-        # Re-subscribe same users to the same streams.
-        self.subscribe_via_post(
-            desdemona,
-            stream_names,
-            dict(principals=orjson.dumps(user_ids).decode()),
-        )
-        # DB-refresh streams.
-        streams_subscriber_counts_after_resubscribe = self.fetch_streams_subscriber_count(
-            stream_ids
-        )
-        # Ensure Idempotency; subscribing "already" subscribed users shouldn't change subscriber_count.
-        self.assert_stream_subscriber_count(
-            streams_subscriber_counts_after_subscribe,
-            streams_subscriber_counts_after_resubscribe,
-            expected_difference=0,
-        )
-
-    def test_stream_subscriber_count_upon_bulk_unsubscription(self) -> None:
-        """
-        Test subscriber_count decreases for the correct streams
-        upon bulk un-subscription.
-
-        We use the api here as we want this to be end-to-end.
-        """
-
-        stream_names = [f"stream_{i}" for i in range(10)]
-        stream_ids = {self.make_stream(stream_name).id for stream_name in stream_names}
-
-        desdemona = self.example_user("desdemona")
-        self.login_user(desdemona)
-
-        user_ids = [
-            desdemona.id,
-            self.example_user("cordelia").id,
-            self.example_user("hamlet").id,
-            self.example_user("othello").id,
-            self.example_user("iago").id,
-            self.example_user("prospero").id,
-        ]
-
-        # Subscribe users to the streams.
-        self.subscribe_via_post(
-            desdemona,
-            stream_names,
-            dict(principals=orjson.dumps(user_ids).decode()),
-        )
-
-        streams_subscriber_counts_before_unsubscribe = self.fetch_streams_subscriber_count(
-            stream_ids
-        )
-        other_streams_subscriber_counts_before_unsubscribe = (
-            self.fetch_other_streams_subscriber_count(stream_ids)
-        )
-
-        # Unsubscribe users from the same streams.
-        self.client_delete(
-            "/json/users/me/subscriptions",
-            {
-                "subscriptions": orjson.dumps(stream_names).decode(),
-                "principals": orjson.dumps(user_ids).decode(),
-            },
-        )
-
-        # DB-refresh streams.
-        streams_subscriber_counts_after_unsubscribe = self.fetch_streams_subscriber_count(
-            stream_ids
-        )
-        # DB-refresh other streams.
-        other_streams_subscriber_counts_after_unsubscribe = (
-            self.fetch_other_streams_subscriber_count(stream_ids)
-        )
-
-        # Ensure a decrease in subscriber_count
-        self.assert_stream_subscriber_count(
-            streams_subscriber_counts_before_unsubscribe,
-            streams_subscriber_counts_after_unsubscribe,
-            expected_difference=-len(user_ids),
-        )
-
-        # Make sure other streams are not affected.
-        self.assert_stream_subscriber_count(
-            other_streams_subscriber_counts_before_unsubscribe,
-            other_streams_subscriber_counts_after_unsubscribe,
-            expected_difference=0,
-        )
-
-        # Re-Unsubscribe users from the same streams.
-        self.client_delete(
-            "/json/users/me/subscriptions",
-            {
-                "subscriptions": orjson.dumps(stream_names).decode(),
-                "principals": orjson.dumps(user_ids).decode(),
-            },
-        )
-        # DB-refresh streams.
-        streams_subscriber_counts_after_reunsubscribe = self.fetch_streams_subscriber_count(
-            stream_ids
-        )
-        # Ensure Idempotency; unsubscribing "already" non-subscribed users shouldn't change subscriber_count.
-        self.assert_stream_subscriber_count(
-            streams_subscriber_counts_after_unsubscribe,
-            streams_subscriber_counts_after_reunsubscribe,
-            expected_difference=0,
-        )
-
     def test_notification_bot_dm_on_subscription(self) -> None:
         desdemona = self.example_user("desdemona")
         realm = desdemona.realm
@@ -5170,6 +5009,110 @@ class SubscriptionAPITest(ZulipTestCase):
         self.assertNotIn("new_subscription_messages_sent", data)
 
 
+class StreamSubscriberCountTest(ZulipTestCase):
+    desdemona: UserProfile
+    cordelia: UserProfile
+    hamlet: UserProfile
+    othello: UserProfile
+    iago: UserProfile
+    prospero: UserProfile
+    stream_names: list[str]
+    stream_ids: set[int]
+
+    @classmethod
+    @override
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.stream_names = [f"stream_{i}" for i in range(10)]
+        cls.stream_ids = {stream.id for stream in cls.make_streams(cls.stream_names)}
+        cls.desdemona, cls.cordelia, cls.hamlet, cls.othello, cls.iago, cls.prospero = (
+            cls.example_users("desdemona", "cordelia", "hamlet", "othello", "iago", "prospero")
+        )
+
+    def assert_subscriber_count_change(
+        self, mutate: Callable[[], None], expected_difference: int
+    ) -> None:
+        (
+            streams_subscriber_counts_before,
+            other_streams_subscriber_counts_before,
+        ) = self.split_streams_subscriber_count(
+            self.fetch_all_streams_subscriber_count(), self.stream_ids
+        )
+
+        mutate()
+
+        # DB-refresh streams and other streams.
+        (
+            streams_subscriber_counts_after,
+            other_streams_subscriber_counts_after,
+        ) = self.split_streams_subscriber_count(
+            self.fetch_all_streams_subscriber_count(), self.stream_ids
+        )
+
+        self.assert_stream_subscriber_count(
+            streams_subscriber_counts_before,
+            streams_subscriber_counts_after,
+            expected_difference=expected_difference,
+        )
+
+        # Make sure other streams are not affected.
+        self.assert_stream_subscriber_count(
+            other_streams_subscriber_counts_before,
+            other_streams_subscriber_counts_after,
+            expected_difference=0,
+        )
+
+    def test_stream_subscriber_count_upon_bulk_subscription_changes(self) -> None:
+        """
+        Test subscriber_count changes for the correct streams upon
+        bulk subscription and un-subscription, and that repeating
+        either of them doesn't change it.
+
+        We use the api here as we want this to be end-to-end.
+        """
+
+        self.login_user(self.desdemona)
+
+        user_ids = [
+            self.desdemona.id,
+            self.cordelia.id,
+            self.hamlet.id,
+            self.othello.id,
+            self.iago.id,
+            self.prospero.id,
+        ]
+        principals = orjson.dumps(user_ids).decode()
+        unsubscribe_params = {
+            "subscriptions": orjson.dumps(self.stream_names).decode(),
+            "principals": principals,
+        }
+
+        def subscribe() -> None:
+            self.subscribe_via_post(
+                self.desdemona,
+                self.stream_names,
+                dict(principals=principals),
+            )
+
+        def unsubscribe() -> None:
+            result = self.client_delete("/json/users/me/subscriptions", unsubscribe_params)
+            self.assert_json_success(result)
+
+        # These run in order; each step starts from the state the
+        # previous one left behind.
+        steps: list[tuple[str, Callable[[], None], int]] = [
+            ("subscribe", subscribe, len(user_ids)),
+            # Ensure Idempotency; subscribing "already" subscribed users shouldn't change subscriber_count.
+            ("resubscribe", subscribe, 0),
+            ("unsubscribe", unsubscribe, -len(user_ids)),
+            # Ensure Idempotency; unsubscribing "already" non-subscribed users shouldn't change subscriber_count.
+            ("reunsubscribe", unsubscribe, 0),
+        ]
+        for op, mutate, expected_difference in steps:
+            with self.subTest(op=op):
+                self.assert_subscriber_count_change(mutate, expected_difference)
+
+
 class InviteOnlyStreamTest(ZulipTestCase):
     def test_must_be_subbed_to_send(self) -> None:
         """
@@ -1858,28 +1858,24 @@ class ActivateTest(ZulipTestCase):
         # Test subscriber_count decrements upon deactivating a user.
         # We use the api here as we want this to be end-to-end.
 
-        admin = self.example_user("othello")
-        do_change_user_role(admin, UserProfile.ROLE_REALM_ADMINISTRATOR, acting_user=None)
-        self.login("othello")
+        self.login("iago")
         user = self.example_user("hamlet")
 
-        streams_subscriber_counts_before = self.build_streams_subscriber_count(
-            streams=get_user_subscribed_streams(user)
-        )
-        stream_ids = set(streams_subscriber_counts_before)
-        other_streams_subscriber_counts_before = self.fetch_other_streams_subscriber_count(
-            stream_ids
+        stream_ids = set(get_user_subscribed_streams(user).values_list("id", flat=True))
+        streams_subscriber_counts_before, other_streams_subscriber_counts_before = (
+            self.split_streams_subscriber_count(
+                self.fetch_all_streams_subscriber_count(), stream_ids
+            )
         )
 
         result = self.client_delete(f"/json/users/{user.id}")
         self.assert_json_success(result)
 
-        # DB-refresh streams.
-        streams_subscriber_counts_after = self.fetch_streams_subscriber_count(stream_ids)
-
-        # DB-refresh other_streams.
-        other_streams_subscriber_counts_after = self.fetch_other_streams_subscriber_count(
-            stream_ids
+        # DB-refresh streams and other_streams.
+        streams_subscriber_counts_after, other_streams_subscriber_counts_after = (
+            self.split_streams_subscriber_count(
+                self.fetch_all_streams_subscriber_count(), stream_ids
+            )
         )
 
         # Deactivating a user should result in subscriber_count - 1
@@ -1900,33 +1896,29 @@ class ActivateTest(ZulipTestCase):
         # Test subscriber_count increments upon reactivating a user.
         # We use the api here as we want this to be end-to-end.
 
-        admin = self.example_user("othello")
-        do_change_user_role(admin, UserProfile.ROLE_REALM_ADMINISTRATOR, acting_user=None)
-        self.login("othello")
+        self.login("iago")
         user = self.example_user("hamlet")
 
         # First, deactivate that user
         result = self.client_delete(f"/json/users/{user.id}")
         self.assert_json_success(result)
 
-        streams_subscriber_counts_before = self.build_streams_subscriber_count(
-            streams=get_user_subscribed_streams(user)
-        )
-        stream_ids = set(streams_subscriber_counts_before)
-        other_streams_subscriber_counts_before = self.fetch_other_streams_subscriber_count(
-            stream_ids
+        stream_ids = set(get_user_subscribed_streams(user).values_list("id", flat=True))
+        streams_subscriber_counts_before, other_streams_subscriber_counts_before = (
+            self.split_streams_subscriber_count(
+                self.fetch_all_streams_subscriber_count(), stream_ids
+            )
         )
 
         # Reactivate user
         result = self.client_post(f"/json/users/{user.id}/reactivate")
         self.assert_json_success(result)
 
-        # DB-refresh streams.
-        streams_subscriber_counts_after = self.fetch_streams_subscriber_count(stream_ids)
-
-        # DB-refresh other_streams.
-        other_streams_subscriber_counts_after = self.fetch_other_streams_subscriber_count(
-            stream_ids
+        # DB-refresh streams and other_streams.
+        streams_subscriber_counts_after, other_streams_subscriber_counts_after = (
+            self.split_streams_subscriber_count(
+                self.fetch_all_streams_subscriber_count(), stream_ids
+            )
         )
 
         # Reactivating a user should result in subscriber_count + 1